@@ -1,8 +1,11 @@
 import customtkinter as ctk
 import win32api
 import win32con
+import win32gui
 import threading
+import queue
 import time
+import functools
 import ctypes
 import json
 import os
@@ -11,10 +14,19 @@ import subprocess
 import re
 import webbrowser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tkinter import messagebox
+from collections import defaultdict
 from dataclasses import dataclass, asdict, field
 from typing import List, Optional, Tuple, Dict
 
+# Optional: orjson (C encoder) varsa config I/O onunla yapılır
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
 from PIL import Image, ImageDraw
 import pystray
 from pystray import MenuItem as item
@@ -28,7 +40,7 @@ from pystray import MenuItem as item
 # ============================================================
 
 APP_NAME = "Omen Hz Controller Pro"
-MONITOR_INTERVAL_SEC = 3
+MONITOR_HEARTBEAT_SEC = 60
 APP_VERSION = "1.0"
 PROGRAMS_URL = "https://www.saydut.com/static/programs.json"
 PROGRAM_ID = "pc-performans-ayarlayici"
@@ -41,6 +53,32 @@ def ensure_config_dir() -> None:
     os.makedirs(CONFIG_DIR, exist_ok=True)
 
 
+def _ttl_cache(seconds: float):
+    """
+    Kısa TTL'li cache: status yenileme + monitor + tray aynı anda sorduğunda
+    tek gerçek Win32/powercfg çağrısı yapılır. fn.invalidate() ile düşürülür.
+    """
+    def deco(fn):
+        state = {"t": 0.0, "v": None}
+
+        @functools.wraps(fn)
+        def wrapper():
+            now = time.monotonic()
+            if now - state["t"] >= seconds:
+                state["v"] = fn()
+                state["t"] = now
+            return state["v"]
+
+        def invalidate():
+            state["t"] = 0.0
+
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return deco
+
+
+@functools.lru_cache(maxsize=32)
 def _semver_tuple(v: str) -> tuple[int, int, int]:
     v = (v or "").strip()
     if v.startswith("v"):
@@ -55,10 +93,26 @@ def _semver_tuple(v: str) -> tuple[int, int, int]:
     return tuple(out)  # type: ignore
 
 
-def _http_get_json(url: str, timeout: int = 15) -> dict:
-    response = requests.get(url, timeout=timeout)
-    response.raise_for_status()
-    return response.json()
+APP_VERSION_TUPLE = _semver_tuple(APP_VERSION)
+
+
+# (connect, read) ayrı ayrı: bağlantı kurulamıyorsa 3 sn'de pes et,
+# tek timeout=15 gibi UI'ı uzun süre bekletme.
+HTTP_TIMEOUT = (3, 8)
+
+# Tek Session: keep-alive ile TCP+TLS el sıkışması çağrılar arasında paylaşılır
+_HTTP = requests.Session()
+_HTTP.headers.update({
+    "User-Agent": f"{APP_NAME}/{APP_VERSION}",
+    "Accept-Encoding": "gzip",
+})
+_http_adapter = HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=2,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+_HTTP.mount("https://", _http_adapter)
+_HTTP.mount("http://", _http_adapter)
 
 
 # ============================================================
@@ -75,6 +129,13 @@ class PowerStatus(ctypes.Structure):
     ]
 
 
+# Tek struct yeter; GetSystemPowerStatus her çağrıda üzerine yazar.
+_PS = PowerStatus()
+
+# WM_POWERBROADCAST geldiğinde set edilir; monitor thread'i bunu bekler.
+_power_event = threading.Event()
+
+
 def is_plugged_in() -> Optional[bool]:
     """
     True  -> prizde
@@ -82,13 +143,12 @@ def is_plugged_in() -> Optional[bool]:
     None  -> okunamadı
     """
     try:
-        status = PowerStatus()
-        ok = ctypes.windll.kernel32.GetSystemPowerStatus(ctypes.byref(status))
+        ok = ctypes.windll.kernel32.GetSystemPowerStatus(ctypes.byref(_PS))
         if not ok:
             return None
-        if status.ACLineStatus == 1:
+        if _PS.ACLineStatus == 1:
             return True
-        if status.ACLineStatus == 0:
+        if _PS.ACLineStatus == 0:
             return False
         return None
     except Exception:
@@ -98,9 +158,67 @@ def is_plugged_in() -> Optional[bool]:
 # ============================================================
 # Display / Hz
 # ============================================================
+WM_DISPLAYCHANGE = 0x007E
+WM_POWERBROADCAST = 0x0218
+PBT_APMPOWERSTATUSCHANGE = 0x000A
+PBT_POWERSETTINGCHANGE = 0x8013
+GUID_ACDC_POWER_SOURCE = "5d3e9a59-e9d5-4b00-a6bd-ff34ff516548"
+
+# Cihaz adı + (w, h, bpp) -> desteklenen Hz listesi cache'i.
+# WM_DISPLAYCHANGE gelince temizlenir; her apply'da yüzlerce
+# EnumDisplaySettings çağrısı yapmamak için.
+_display_cache: Dict[str, object] = {"dev": None, "modes": {}}
+
+
+def _invalidate_display_cache() -> None:
+    _display_cache["dev"] = None
+    _display_cache["modes"].clear()
+
+
+def _message_window_listener() -> None:
+    """
+    Gizli bir mesaj penceresi açar; WM_DISPLAYCHANGE gelince cache'i boşaltır,
+    WM_POWERBROADCAST (priz/batarya değişimi) gelince monitor thread'ini uyandırır.
+    """
+    def wndproc(hwnd, msg, wparam, lparam):
+        if msg == WM_DISPLAYCHANGE:
+            _invalidate_display_cache()
+        elif msg == WM_POWERBROADCAST and wparam in (PBT_APMPOWERSTATUSCHANGE, PBT_POWERSETTINGCHANGE):
+            _power_event.set()
+        return win32gui.DefWindowProc(hwnd, msg, wparam, lparam)
+
+    try:
+        wc = win32gui.WNDCLASS()
+        wc.lpfnWndProc = wndproc
+        wc.lpszClassName = "OmenHzMsgWindow"
+        wc.hInstance = win32api.GetModuleHandle(None)
+        atom = win32gui.RegisterClass(wc)
+        hwnd = win32gui.CreateWindow(atom, "", 0, 0, 0, 0, 0, 0, 0, wc.hInstance, None)
+        try:
+            # AC/DC kaynağı değişince uyan; olmazsa heartbeat zaten devrede
+            ctypes.windll.user32.RegisterPowerSettingNotification(
+                hwnd,
+                ctypes.byref(guid_from_str(GUID_ACDC_POWER_SOURCE)),
+                0,  # DEVICE_NOTIFY_WINDOW_HANDLE
+            )
+        except Exception:
+            pass
+        win32gui.PumpMessages()
+    except Exception:
+        pass
+
+
+def start_message_listener() -> None:
+    threading.Thread(target=_message_window_listener, daemon=True).start()
+
+
 def get_primary_device_name() -> Optional[str]:
+    dev = _display_cache["dev"]
+    if dev:
+        return dev
     try:
         device = win32api.EnumDisplayDevices(None, 0)
+        _display_cache["dev"] = device.DeviceName
         return device.DeviceName
     except Exception:
         return None
@@ -116,6 +234,7 @@ def get_current_settings():
         return None
 
 
+@_ttl_cache(0.5)
 def get_current_hz() -> Optional[int]:
     s = get_current_settings()
     if not s:
@@ -126,43 +245,93 @@ def get_current_hz() -> Optional[int]:
         return None
 
 
+class DEVMODEW(ctypes.Structure):
+    _fields_ = [
+        ("dmDeviceName", ctypes.c_wchar * 32),
+        ("dmSpecVersion", ctypes.c_uint16),
+        ("dmDriverVersion", ctypes.c_uint16),
+        ("dmSize", ctypes.c_uint16),
+        ("dmDriverExtra", ctypes.c_uint16),
+        ("dmFields", ctypes.c_uint32),
+        ("dmPositionX", ctypes.c_int32),
+        ("dmPositionY", ctypes.c_int32),
+        ("dmDisplayOrientation", ctypes.c_uint32),
+        ("dmDisplayFixedOutput", ctypes.c_uint32),
+        ("dmColor", ctypes.c_int16),
+        ("dmDuplex", ctypes.c_int16),
+        ("dmYResolution", ctypes.c_int16),
+        ("dmTTOption", ctypes.c_int16),
+        ("dmCollate", ctypes.c_int16),
+        ("dmFormName", ctypes.c_wchar * 32),
+        ("dmLogPixels", ctypes.c_uint16),
+        ("dmBitsPerPel", ctypes.c_uint32),
+        ("dmPelsWidth", ctypes.c_uint32),
+        ("dmPelsHeight", ctypes.c_uint32),
+        ("dmDisplayFlags", ctypes.c_uint32),
+        ("dmDisplayFrequency", ctypes.c_uint32),
+        ("dmICMMethod", ctypes.c_uint32),
+        ("dmICMIntent", ctypes.c_uint32),
+        ("dmMediaType", ctypes.c_uint32),
+        ("dmDitherType", ctypes.c_uint32),
+        ("dmReserved1", ctypes.c_uint32),
+        ("dmReserved2", ctypes.c_uint32),
+        ("dmPanningWidth", ctypes.c_uint32),
+        ("dmPanningHeight", ctypes.c_uint32),
+    ]
+
+
+def _enumerate_all_modes(dev: str) -> Dict[Tuple[int, int, int], List[int]]:
+    """
+    Adaptörün TÜM modlarını tek geçişte toplar: {(w, h, bpp): sorted_hz}.
+    EnumDisplaySettingsExW bool döner; pywin32'nin mod başına exception
+    fırlatmasına ve DEVMODE wrapper allocate etmesine gerek kalmaz.
+    """
+    freqs: Dict[Tuple[int, int, int], set] = defaultdict(set)
+    try:
+        enum_settings = ctypes.windll.user32.EnumDisplaySettingsExW
+        dm = DEVMODEW()
+        dm.dmSize = ctypes.sizeof(DEVMODEW)
+        ref = ctypes.byref(dm)
+        i = 0
+        while enum_settings(dev, i, ref, 0):
+            f = dm.dmDisplayFrequency
+            if 20 <= f <= 500:
+                freqs[(dm.dmPelsWidth, dm.dmPelsHeight, dm.dmBitsPerPel)].add(f)
+            i += 1
+    except Exception:
+        pass
+
+    return {k: sorted(v) for k, v in freqs.items()}
+
+
 def list_supported_hz_for_current_mode() -> List[int]:
     """
-    Mevcut çözünürlük + bpp için desteklenen Hz enumerates.
-    Strict boş dönerse loose fallback uygular (bazı driver'larda şart).
+    Mevcut çözünürlük + bpp için desteklenen Hz listesi.
+    Mod tablosu tek enumerasyonla doldurulur ve WM_DISPLAYCHANGE'e kadar
+    cache'te kalır; strict boşsa loose (bpp'siz) fallback uygular
+    (bazı driver'larda şart).
     """
     dev = get_primary_device_name()
     cur = get_current_settings()
     if not dev or not cur:
         return []
 
-    target_w, target_h = int(cur.PelsWidth), int(cur.PelsHeight)
-    target_bpp = int(cur.BitsPerPel)
-
-    freqs_strict = set()
-    freqs_loose = set()
+    modes = _display_cache["modes"]
+    if not modes:
+        modes.update(_enumerate_all_modes(dev))
 
-    i = 0
-    while True:
-        try:
-            s = win32api.EnumDisplaySettings(dev, i)
-        except Exception:
-            break
-
-        try:
-            w, h, bpp, f = int(s.PelsWidth), int(s.PelsHeight), int(s.BitsPerPel), int(s.DisplayFrequency)
-            if 20 <= f <= 500:
-                if w == target_w and h == target_h:
-                    freqs_loose.add(f)
-                    if bpp == target_bpp:
-                        freqs_strict.add(f)
-        except Exception:
-            pass
+    # DEVMODE alanları zaten int; tekrar int()'e sarmaya gerek yok
+    target_w, target_h = cur.PelsWidth, cur.PelsHeight
 
-        i += 1
+    strict = modes.get((target_w, target_h, cur.BitsPerPel))
+    if strict:
+        return strict
 
-    out = sorted(freqs_strict) if freqs_strict else sorted(freqs_loose)
-    return out
+    loose = set()
+    for (w, h, _), fs in modes.items():
+        if w == target_w and h == target_h:
+            loose.update(fs)
+    return sorted(loose)
 
 
 def set_hz(hz: int) -> Tuple[bool, str]:
@@ -184,17 +353,127 @@ def set_hz(hz: int) -> Tuple[bool, str]:
 
         cur.DisplayFrequency = hz
         win32api.ChangeDisplaySettings(cur, 0)
+        get_current_hz.invalidate()
         return True, "OK"
     except Exception as e:
         return False, f"Hata: {e}"
 
 
+# ============================================================
+# PowrProf API (in-proc güç ayarı; powercfg spawn maliyeti yok)
+# ============================================================
+class GUID(ctypes.Structure):
+    _fields_ = [
+        ("Data1", ctypes.c_uint32),
+        ("Data2", ctypes.c_uint16),
+        ("Data3", ctypes.c_uint16),
+        ("Data4", ctypes.c_ubyte * 8),
+    ]
+
+
+def guid_from_str(s: str) -> GUID:
+    parts = s.strip("{}").split("-")
+    g = GUID()
+    g.Data1 = int(parts[0], 16)
+    g.Data2 = int(parts[1], 16)
+    g.Data3 = int(parts[2], 16)
+    tail = bytes.fromhex(parts[3] + parts[4])
+    for i in range(8):
+        g.Data4[i] = tail[i]
+    return g
+
+
+try:
+    _powrprof = ctypes.windll.powrprof
+except Exception:
+    _powrprof = None
+
+# GUID string'leri bir kere parse edilir; scheme/setting sabitleri her
+# API çağrısında yeniden struct'a çevrilmez.
+_guid_structs: Dict[str, GUID] = {}
+
+
+def _guid_of(s: str) -> GUID:
+    g = _guid_structs.get(s)
+    if g is None:
+        g = guid_from_str(s)
+        _guid_structs[s] = g
+    return g
+
+
+def _power_write_value_index(ac: bool, scheme: str, subgroup: str, setting: str, value: int) -> bool:
+    """
+    PowerWriteACValueIndex/PowerWriteDCValueIndex; 0 (ERROR_SUCCESS) -> True.
+    """
+    if _powrprof is None:
+        return False
+    try:
+        fn = _powrprof.PowerWriteACValueIndex if ac else _powrprof.PowerWriteDCValueIndex
+        rc = fn(
+            None,
+            ctypes.byref(_guid_of(scheme)),
+            ctypes.byref(_guid_of(subgroup)),
+            ctypes.byref(_guid_of(setting)),
+            int(value),
+        )
+        return rc == 0
+    except Exception:
+        return False
+
+
+def _power_set_active_scheme(guid: str) -> bool:
+    if _powrprof is None:
+        return False
+    try:
+        return _powrprof.PowerSetActiveScheme(None, ctypes.byref(_guid_of(guid))) == 0
+    except Exception:
+        return False
+
+
+def _power_get_active_scheme_guid() -> Optional[str]:
+    """
+    Aktif plan GUID'i: önce PowerGetActiveScheme, olmazsa küçük bir
+    powercfg /getactivescheme çıktısından parse (tam /list parse'a gerek yok).
+    """
+    if _powrprof is not None:
+        try:
+            pguid = ctypes.POINTER(GUID)()
+            if _powrprof.PowerGetActiveScheme(None, ctypes.byref(pguid)) == 0:
+                g = pguid.contents
+                s = "%08x-%04x-%04x-%s-%s" % (
+                    g.Data1,
+                    g.Data2,
+                    g.Data3,
+                    bytes(g.Data4[:2]).hex(),
+                    bytes(g.Data4[2:]).hex(),
+                )
+                ctypes.windll.kernel32.LocalFree(pguid)
+                return s
+        except Exception:
+            pass
+
+    rc, out, _ = _run_powercfg(["/getactivescheme"])
+    if rc == 0:
+        m = _GUID_RE.search(out)
+        if m:
+            return m.group(0)
+    return None
+
+
 # ============================================================
 # powercfg helpers
 # ============================================================
-def _run_powercfg(args: List[str]) -> Tuple[int, str]:
+_GUID_LINE_RE = re.compile(
+    r"^\s*Power Scheme GUID:\s*([0-9a-fA-F\-]{36})\s*\((.*?)\)\s*(\*)?\s*$",
+    re.MULTILINE,
+)
+_GUID_RE = re.compile(r"[0-9a-fA-F\-]{36}")
+
+
+def _run_powercfg(args: List[str]) -> Tuple[int, str, str]:
     """
-    returns: (returncode, combined_output)
+    returns: (returncode, stdout, stderr)
+    stdout/stderr ayrı döner; başarı yolunda concat + strip maliyeti yok.
     """
     try:
         p = subprocess.run(
@@ -204,33 +483,46 @@ def _run_powercfg(args: List[str]) -> Tuple[int, str]:
             text=True,
             creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, "CREATE_NO_WINDOW") else 0,
         )
-        out = (p.stdout or "") + "\n" + (p.stderr or "")
-        return p.returncode, out.strip()
+        return p.returncode, p.stdout or "", p.stderr or ""
     except Exception as e:
-        return 1, str(e)
+        return 1, "", str(e)
+
+
+def _run_powercfg_batch(commands: List[List[str]]) -> bool:
+    """
+    Birden çok powercfg komutunu tek bir cmd.exe çağrısında koşturur
+    (spawn maliyeti komut başına değil, toplamda bir kere ödenir).
+    """
+    try:
+        joined = " && ".join("powercfg " + " ".join(args) for args in commands)
+        p = subprocess.run(
+            ["cmd.exe", "/d", "/c", joined],
+            check=False,
+            capture_output=True,
+            text=True,
+            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, "CREATE_NO_WINDOW") else 0,
+        )
+        return p.returncode == 0
+    except Exception:
+        return False
 
 
 def list_power_schemes() -> List[Tuple[str, str, bool]]:
     """
     returns: [(guid, name, is_active), ...]
     """
-    rc, txt = _run_powercfg(["/list"])
+    rc, txt, _ = _run_powercfg(["/list"])
     if rc != 0:
         return []
 
-    schemes: List[Tuple[str, str, bool]] = []
-    guid_re = re.compile(r"Power Scheme GUID:\s*([0-9a-fA-F\-]{36})\s*\((.*?)\)\s*(\*)?")
-    for line in txt.splitlines():
-        m = guid_re.search(line)
-        if not m:
-            continue
-        guid = m.group(1).strip()
-        name = m.group(2).strip()
-        is_active = bool(m.group(3))
-        schemes.append((guid, name, is_active))
-    return schemes
+    # Tek geçiş: satır satır bölmek yerine tüm çıktı üstünde finditer
+    return [
+        (m.group(1), m.group(2).strip(), bool(m.group(3)))
+        for m in _GUID_LINE_RE.finditer(txt)
+    ]
 
 
+@_ttl_cache(0.5)
 def get_active_power_scheme() -> Tuple[Optional[str], Optional[str]]:
     schemes = list_power_schemes()
     for guid, name, active in schemes:
@@ -242,19 +534,23 @@ def get_active_power_scheme() -> Tuple[Optional[str], Optional[str]]:
 def set_power_scheme_by_guid(guid: str) -> Tuple[bool, str]:
     if not guid:
         return False, "GUID boş."
-    rc, out = _run_powercfg(["/setactive", guid])
-    if rc != 0:
-        return False, out or "powercfg /setactive başarısız."
-    active_guid, _ = get_active_power_scheme()
+    if not _power_set_active_scheme(guid):
+        rc, out, err = _run_powercfg(["/setactive", guid])
+        if rc != 0:
+            return False, (err or out).strip() or "powercfg /setactive başarısız."
+    get_active_power_scheme.invalidate()
+    # Doğrulama: tüm listeyi parse etmek yerine sadece aktif GUID'i sor
+    active_guid = _power_get_active_scheme_guid()
     if (active_guid or "").lower() == guid.lower():
         return True, "OK"
     return False, "Plan değişti doğrulanamadı (OEM kısıtı olabilir)."
 
 
 def restore_default_power_schemes() -> Tuple[bool, str]:
-    rc, out = _run_powercfg(["-restoredefaultschemes"])
+    rc, out, err = _run_powercfg(["-restoredefaultschemes"])
     if rc != 0:
-        return False, out or "restoredefaultschemes başarısız (Admin gerekli olabilir)."
+        return False, (err or out).strip() or "restoredefaultschemes başarısız (Admin gerekli olabilir)."
+    get_active_power_scheme.invalidate()
     return True, "Standart planlar geri yüklendi."
 
 
@@ -264,21 +560,22 @@ def duplicate_scheme(base_guid: str) -> Tuple[Optional[str], str]:
     """
     if not base_guid:
         return None, "Base GUID boş."
-    rc, out = _run_powercfg(["-duplicatescheme", base_guid])
+    rc, out, err = _run_powercfg(["-duplicatescheme", base_guid])
     if rc != 0:
-        return None, out or "duplicatescheme başarısız (Admin gerekli olabilir)."
-    m = re.search(r"([0-9a-fA-F\-]{36})", out)
+        return None, (err or out).strip() or "duplicatescheme başarısız (Admin gerekli olabilir)."
+    # Yeni GUID stdout'ta; stderr concat etmeden direkt ara
+    m = _GUID_RE.search(out)
     if not m:
         return None, f"Yeni GUID parse edilemedi: {out}"
-    return m.group(1), "OK"
+    return m.group(0), "OK"
 
 
 def change_scheme_name(guid: str, name: str, description: str = "") -> Tuple[bool, str]:
     if not guid:
         return False, "GUID boş."
-    rc, out = _run_powercfg(["-changename", guid, name, description])
+    rc, out, err = _run_powercfg(["-changename", guid, name, description])
     if rc != 0:
-        return False, out or "changename başarısız."
+        return False, (err or out).strip() or "changename başarısız."
     return True, "OK"
 
 
@@ -304,11 +601,19 @@ CPMINCORES = "0cc5b647-c1df-4637-891a-dec35c318583"
 SYSTEMCOOLINGPOLICY = "94d3a615-a899-4ac5-ae2b-e4d8f634367f"
 
 
+# Son başarıyla yazılan policy; aynı değerlerle tekrar çağrılırsa hiç
+# Win32 işi yapılmaz (auto-mode'da her AC/DC geçişinde gereksiz yazımı önler).
+_last_applied: Optional[tuple] = None
+
+
 def _set_value_index(ac: bool, scheme: str, subgroup: str, setting: str, value: int) -> Tuple[bool, str]:
+    if _power_write_value_index(ac, scheme, subgroup, setting, int(value)):
+        return True, "OK"
+    # API yoksa/başarısızsa powercfg fallback
     cmd = "/setacvalueindex" if ac else "/setdcvalueindex"
-    rc, out = _run_powercfg([cmd, scheme, subgroup, setting, str(int(value))])
+    rc, out, err = _run_powercfg([cmd, scheme, subgroup, setting, str(int(value))])
     if rc != 0:
-        return False, out or f"{cmd} başarısız."
+        return False, (err or out).strip() or f"{cmd} başarısız."
     return True, "OK"
 
 
@@ -342,36 +647,46 @@ def apply_cpu_policy_to_scheme(
 
     is_ac = bool(plugged)
 
-    ok, msg = _set_value_index(is_ac, scheme_guid, SUB_PROCESSOR, PERFEPP, epp)
-    if not ok:
-        return False, f"EPP ayarlanamadı: {msg}"
-
-    # Boost (bazı cihazlarda yok)
-    _set_value_index(is_ac, scheme_guid, SUB_PROCESSOR, PERFBOOSTMODE, boost_mode)
-
-    ok, msg = _set_value_index(is_ac, scheme_guid, SUB_PROCESSOR, PROCTHROTTLEMIN, cpu_min)
-    if not ok:
-        return False, f"Min CPU ayarlanamadı: {msg}"
-
-    ok, msg = _set_value_index(is_ac, scheme_guid, SUB_PROCESSOR, PROCTHROTTLEMAX, cpu_max)
-    if not ok:
-        return False, f"Max CPU ayarlanamadı: {msg}"
+    global _last_applied
+    key = (scheme_guid, is_ac, epp, boost_mode, cpu_min, cpu_max, core_parking_min, cooling_policy)
+    if key == _last_applied:
+        return True, "no-op"
+
+    # (setting_guid, value, zorunlu ayarın etiketi; None -> bazı cihazlarda yok, hata sayma)
+    settings = [
+        (PERFEPP, epp, "EPP"),
+        (PERFBOOSTMODE, boost_mode, None),
+        (PROCTHROTTLEMIN, cpu_min, "Min CPU"),
+        (PROCTHROTTLEMAX, cpu_max, "Max CPU"),
+        (CPMINCORES, core_parking_min, None),
+        (SYSTEMCOOLINGPOLICY, cooling_policy, None),
+    ]
 
-    # Core parking (bazı cihazlarda yok)
-    _set_value_index(is_ac, scheme_guid, SUB_PROCESSOR, CPMINCORES, core_parking_min)
+    if _powrprof is None:
+        # API yoksa: 6 ayrı spawn yerine tek cmd.exe batch dene;
+        # batch başarısızsa hangi ayarın patladığını bulmak için tek tek.
+        cmd = "/setacvalueindex" if is_ac else "/setdcvalueindex"
+        batch = [[cmd, scheme_guid, SUB_PROCESSOR, s, str(int(v))] for s, v, _ in settings]
+        if _run_powercfg_batch(batch):
+            settings = []
 
-    # Cooling policy (bazı cihazlarda yok)
-    _set_value_index(is_ac, scheme_guid, SUB_PROCESSOR, SYSTEMCOOLINGPOLICY, cooling_policy)
+    for setting, value, label in settings:
+        ok, msg = _set_value_index(is_ac, scheme_guid, SUB_PROCESSOR, setting, value)
+        if not ok and label:
+            return False, f"{label} ayarlanamadı: {msg}"
 
     # uygula
-    _run_powercfg(["/setactive", scheme_guid])
+    if not _power_set_active_scheme(scheme_guid):
+        _run_powercfg(["/setactive", scheme_guid])
+    get_active_power_scheme.invalidate()
+    _last_applied = key
     return True, "OK"
 
 
 # ============================================================
 # Config
 # ============================================================
-@dataclass
+@dataclass(slots=True)
 class CpuPolicy:
     epp: int = 0                 # 0 perf, 100 saving
     boost_mode: int = 1          # 0 off, 1 on, 2 aggressive
@@ -389,7 +704,7 @@ def default_cpu_bat() -> CpuPolicy:
     return CpuPolicy(epp=90, boost_mode=0, cpu_min=5, cpu_max=70, core_parking_min=20, cooling_policy=0)
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     auto_mode: bool = True
     set_power_plan: bool = True
@@ -404,6 +719,12 @@ class AppConfig:
     cpu_ac: CpuPolicy = field(default_factory=default_cpu_ac)      # FIX: default_factory
     cpu_bat: CpuPolicy = field(default_factory=default_cpu_bat)    # FIX: default_factory
 
+    # Sürüm kontrolü cache'i (24 saatte bir + ETag/Last-Modified ile koşullu GET)
+    last_version_check_ts: float = 0.0
+    last_version_etag: str = ""
+    last_version_modified: str = ""
+    cached_latest_version: str = ""
+
 
 def _dict_to_cpu_policy(d: dict, fallback: CpuPolicy) -> CpuPolicy:
     try:
@@ -425,8 +746,9 @@ def load_config() -> AppConfig:
         return AppConfig()
 
     try:
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            raw = json.load(f)
+        with open(CONFIG_PATH, "rb") as f:
+            data = f.read()
+        raw = orjson.loads(data) if orjson is not None else json.loads(data)
 
         cfg = AppConfig(
             auto_mode=bool(raw.get("auto_mode", True)),
@@ -436,6 +758,10 @@ def load_config() -> AppConfig:
             battery_hz=raw.get("battery_hz", None),
             ac_plan_guid=raw.get("ac_plan_guid", None),
             battery_plan_guid=raw.get("battery_plan_guid", None),
+            last_version_check_ts=float(raw.get("last_version_check_ts", 0.0) or 0.0),
+            last_version_etag=str(raw.get("last_version_etag", "") or ""),
+            last_version_modified=str(raw.get("last_version_modified", "") or ""),
+            cached_latest_version=str(raw.get("cached_latest_version", "") or ""),
         )
         cfg.cpu_ac = _dict_to_cpu_policy(raw.get("cpu_ac", {}) or {}, default_cpu_ac())
         cfg.cpu_bat = _dict_to_cpu_policy(raw.get("cpu_bat", {}) or {}, default_cpu_bat())
@@ -444,11 +770,66 @@ def load_config() -> AppConfig:
         return AppConfig()
 
 
-def save_config(cfg: AppConfig) -> None:
+def save_config(cfg: AppConfig, durable: bool = False) -> None:
+    """
+    Atomik yazar (pid'li tmp + os.replace; iki instance çakışmaz).
+    durable=True replace'ten önce fsync de eder — slider debounce yazımları
+    için gereksiz, çıkış/manuel uygula gibi yerlerde istenir.
+    """
     ensure_config_dir()
     payload = asdict(cfg)
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+    tmp = f"{CONFIG_PATH}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        if durable:
+            os.fsync(f.fileno())
+    os.replace(tmp, CONFIG_PATH)
+
+
+VERSION_CHECK_INTERVAL_SEC = 24 * 3600
+
+
+def check_for_update(cfg: AppConfig) -> str:
+    """
+    programs.json'dan bu programın son sürümünü döner ("" -> bilinmiyor).
+    24 saat içinde tekrar istek atmaz; atarken ETag yollar, 304'te cache döner.
+    """
+    if time.time() - cfg.last_version_check_ts < VERSION_CHECK_INTERVAL_SEC:
+        return cfg.cached_latest_version
+
+    headers = {}
+    if cfg.last_version_etag:
+        headers["If-None-Match"] = cfg.last_version_etag
+    if cfg.last_version_modified:
+        headers["If-Modified-Since"] = cfg.last_version_modified
+
+    response = _HTTP.get(PROGRAMS_URL, headers=headers, timeout=HTTP_TIMEOUT)
+    if response.status_code == 304:
+        cfg.last_version_check_ts = time.time()
+        save_config(cfg)
+        return cfg.cached_latest_version
+
+    response.raise_for_status()
+    payload = response.json()
+
+    latest = ""
+    for prog in payload.get("programs", []):
+        if prog.get("id") == PROGRAM_ID:
+            latest = prog.get("version", "") or ""
+            break
+
+    cfg.last_version_check_ts = time.time()
+    cfg.last_version_etag = response.headers.get("ETag", "") or ""
+    cfg.last_version_modified = response.headers.get("Last-Modified", "") or ""
+    cfg.cached_latest_version = latest
+    save_config(cfg)
+    return latest
 
 
 # ============================================================
@@ -468,19 +849,17 @@ COOLING_LABELS = {
     0: "Passive (Kısarak)",
 }
 
+# Ters yön bir kere kurulur; her menü callback'inde linear scan yok
+BOOST_LABEL_TO_VALUE = {v: k for k, v in BOOST_LABELS.items()}
+COOLING_LABEL_TO_VALUE = {v: k for k, v in COOLING_LABELS.items()}
+
 
 def boost_label_to_value(label: str) -> int:
-    for k, v in BOOST_LABELS.items():
-        if v == label:
-            return k
-    return 1
+    return BOOST_LABEL_TO_VALUE.get(label, 1)
 
 
 def cooling_label_to_value(label: str) -> int:
-    for k, v in COOLING_LABELS.items():
-        if v == label:
-            return k
-    return 1
+    return COOLING_LABEL_TO_VALUE.get(label, 1)
 
 
 # Optional: psutil for live CPU info
@@ -489,8 +868,33 @@ try:
 except Exception:
     psutil = None
 
+# psutil sorgularına alt sınır: kim ne kadar sık sorarsa sorsun
+# gerçek örnekleme en fazla _MIN_CPU_INTERVAL'de bir yapılır.
+_LAST_CPU = {"t": 0.0, "pct": 0.0, "ghz": None}
+_MIN_CPU_INTERVAL = 0.8
+
+
+def _sample_cpu() -> Tuple[float, Optional[float]]:
+    now = time.monotonic()
+    if psutil is not None and now - _LAST_CPU["t"] >= _MIN_CPU_INTERVAL:
+        try:
+            # İlk çağrıda küçük bir blocking interval ile prime et;
+            # interval=None ilk seferinde hep 0.0 döndürür.
+            interval = None if _LAST_CPU["t"] > 0 else 0.1
+            pct = psutil.cpu_percent(interval=interval)
+            f = psutil.cpu_freq()
+            _LAST_CPU["pct"] = pct
+            _LAST_CPU["ghz"] = (f.current / 1000.0) if f and f.current else None
+            _LAST_CPU["t"] = now
+        except Exception:
+            pass
+    return _LAST_CPU["pct"], _LAST_CPU["ghz"]
+
 
 class HzApp(ctk.CTk):
+    # Tray ikonu PIL ile bir kere çizilir; her hide/show'da yeniden değil
+    _tray_image = None
+
     def __init__(self):
         super().__init__()
 
@@ -509,11 +913,28 @@ class HzApp(ctk.CTk):
         self._last_plug_state: Optional[bool] = None
         self._apply_lock = threading.Lock()
         self._update_prompted = False
+        self._save_after_id = None  # debounce: bekleyen config yazımı
+        self._last_status_str: Optional[str] = None
+        self._last_live_str: Optional[str] = None
+        self._visible = threading.Event()  # pencere görünürken set; tray-only'de clear
+        # Menü aksiyonları bound method; tuple bir kere kurulur
+        self._tray_menu = (
+            item("Göster", self._tray_show),
+            item("Şimdi Uygula", self._tray_apply),
+            item("Çıkış", self._tray_quit),
+        )
 
         
 
         self._live_after_id = None  # after() job id for live CPU panel
+
+        # psutil örneklemesi GUI thread'inde değil; sampler thread'i cache'i
+        # doldurur, widget sadece okur (tuple ataması CPython'da atomik)
+        self._cpu_cache: Optional[Tuple[float, object]] = None
+        if psutil is not None:
+            threading.Thread(target=self._cpu_sampler, daemon=True).start()
 # Hz
+        start_message_listener()
         self.supported_hz = list_supported_hz_for_current_mode()
         if not self.supported_hz:
             self.supported_hz = [60, 75, 120, 144, 165, 240]
@@ -523,6 +944,7 @@ class HzApp(ctk.CTk):
         self.scheme_display_list: List[str] = []
         self.display_to_guid: Dict[str, str] = {}
         self.guid_to_display: Dict[str, str] = {}
+        self._schemes_sig: Optional[tuple] = None  # menülerin gösterdiği liste imzası
         self.refresh_power_plans(initial=True)
 
         # Defaults Hz
@@ -566,13 +988,15 @@ class HzApp(ctk.CTk):
         self.hz_frame = ctk.CTkFrame(self.container, corner_radius=14)
         self.hz_frame.pack(padx=16, pady=10, fill="x")
 
+        hz_strs = [str(x) for x in self.supported_hz]
+
         ctk.CTkLabel(self.hz_frame, text="Prizde (AC) Hz:").pack(padx=14, pady=(14, 4), anchor="w")
-        self.ac_hz_menu = ctk.CTkOptionMenu(self.hz_frame, values=[str(x) for x in self.supported_hz], command=self.on_ac_hz_selected)
+        self.ac_hz_menu = ctk.CTkOptionMenu(self.hz_frame, values=hz_strs, command=self.on_ac_hz_selected)
         self.ac_hz_menu.set(str(self.cfg.ac_hz))
         self.ac_hz_menu.pack(padx=14, pady=(0, 10), fill="x")
 
         ctk.CTkLabel(self.hz_frame, text="Bataryada Hz:").pack(padx=14, pady=(0, 4), anchor="w")
-        self.bat_hz_menu = ctk.CTkOptionMenu(self.hz_frame, values=[str(x) for x in self.supported_hz], command=self.on_bat_hz_selected)
+        self.bat_hz_menu = ctk.CTkOptionMenu(self.hz_frame, values=hz_strs, command=self.on_bat_hz_selected)
         self.bat_hz_menu.set(str(self.cfg.battery_hz))
         self.bat_hz_menu.pack(padx=14, pady=(0, 14), fill="x")
 
@@ -605,6 +1029,7 @@ class HzApp(ctk.CTk):
         self.btn_make_plans.pack(side="left", expand=True, fill="x", padx=(8, 0))
 
         self._sync_plan_menus_from_config()
+        self._schemes_sig = tuple((g, n) for g, n, _ in self.schemes)
 
         # CPU policy
         self.cpu_frame = ctk.CTkFrame(self.container, corner_radius=14)
@@ -620,14 +1045,15 @@ class HzApp(ctk.CTk):
         self.tab_ac = self.tabs.add("AC (Priz)")
         self.tab_bat = self.tabs.add("Battery (Pil)")
 
-        self._build_cpu_tab(self.tab_ac, mode="ac")
-        self._build_cpu_tab(self.tab_bat, mode="bat")
+        # Tab içerikleri (~18 widget x 2) ilk çizimden sonra kurulur;
+        # pencere önce açılır, kurulum ara layout geçişlerini tetiklemez
+        self.after_idle(self._build_cpu_tabs)
 
         # Apply buttons
         self.btn_frame = ctk.CTkFrame(self.container, corner_radius=14)
         self.btn_frame.pack(padx=16, pady=10, fill="x")
 
-        self.btn_apply_now = ctk.CTkButton(self.btn_frame, text="Şimdi Uygula (Mevcut Duruma Göre)", command=self.apply_for_current_power_state)
+        self.btn_apply_now = ctk.CTkButton(self.btn_frame, text="Şimdi Uygula (Mevcut Duruma Göre)", command=self.apply_now_async)
         self.btn_apply_now.pack(padx=14, pady=(14, 8), fill="x")
 
         self.btn_manual_ac = ctk.CTkButton(
@@ -651,6 +1077,11 @@ class HzApp(ctk.CTk):
         self.hint = ctk.CTkLabel(self.container, text=f"Ayarlar: {CONFIG_PATH}", font=("Roboto", 11), text_color="#aaaaaa")
         self.hint.pack(pady=(6, 10))
 
+        # Worker thread: powercfg/Hz uygulamaları UI thread'ini kilitlemesin
+        self._worker_q: "queue.Queue[tuple]" = queue.Queue()
+        self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
+        self.worker_thread.start()
+
         # Monitor threads
         self.check_thread = threading.Thread(target=self.battery_monitor, daemon=True)
         self.check_thread.start()
@@ -659,17 +1090,22 @@ class HzApp(ctk.CTk):
         self.create_tray_icon()
 
     # ----------------- LIVE INFO -----------------
+    def _cpu_sampler(self):
+        while True:
+            # Pencere gizliyken hiç örnekleme yapma; tray-only'de CPU ~0
+            self._visible.wait()
+            self._cpu_cache = _sample_cpu()
+            time.sleep(1.0)
+
     def _live_text(self) -> str:
         if psutil is None:
             return "Canlı CPU bilgisi: psutil yok (istersen: pip install psutil)"
-        try:
-            p = psutil.cpu_percent(interval=None)
-            f = psutil.cpu_freq()
-            ghz = (f.current / 1000.0) if f and f.current else None
-            ghz_txt = f"{ghz:.2f} GHz" if ghz is not None else "?"
-            return f"CPU: {p:.0f}%  •  Frekans: {ghz_txt}"
-        except Exception:
+        cached = self._cpu_cache
+        if cached is None:
             return "CPU: ?"
+        p, ghz = cached
+        ghz_txt = f"{ghz:.2f} GHz" if ghz is not None else "?"
+        return f"CPU: {p:.0f}%  •  Frekans: {ghz_txt}"
 
 
     def _schedule_live_update(self):
@@ -682,7 +1118,11 @@ class HzApp(ctk.CTk):
             pass
 
         try:
-            self.live_label.configure(text=self._live_text())
+            # Aynı string'i tekrar set etmek bile layout/repaint tetikliyor
+            txt = self._live_text()
+            if txt != self._last_live_str:
+                self._last_live_str = txt
+                self.live_label.configure(text=txt)
         except Exception:
             pass
 
@@ -703,9 +1143,17 @@ class HzApp(ctk.CTk):
             self._live_after_id = None
 
     # ----------------- CPU TAB UI -----------------
+    def _build_cpu_tabs(self):
+        self._build_cpu_tab(self.tab_ac, mode="ac")
+        self._build_cpu_tab(self.tab_bat, mode="bat")
+
     def _build_cpu_tab(self, parent, mode: str):
         pol = self.cfg.cpu_ac if mode == "ac" else self.cfg.cpu_bat
 
+        # Kurulum boyunca geometry propagation kapalı: her pack tek tek
+        # layout çözdürmesin, sonda bir kere çözülsün
+        parent.pack_propagate(False)
+
         # EPP
         ctk.CTkLabel(parent, text="EPP (0=Performans, 100=Tasarruf)").pack(anchor="w", padx=10, pady=(10, 2))
         epp_value_label = ctk.CTkLabel(parent, text=f"{int(pol.epp)}")
@@ -713,7 +1161,7 @@ class HzApp(ctk.CTk):
 
         epp_slider = ctk.CTkSlider(
             parent, from_=0, to=100, number_of_steps=100,
-            command=lambda v: self._on_cpu_slider(mode, "epp", int(v), epp_value_label)
+            command=functools.partial(self._on_cpu_slider, mode, "epp", epp_value_label)
         )
         epp_slider.set(int(pol.epp))
         epp_slider.pack(fill="x", padx=10, pady=(0, 8))
@@ -723,7 +1171,7 @@ class HzApp(ctk.CTk):
         boost_menu = ctk.CTkOptionMenu(
             parent,
             values=[BOOST_LABELS[0], BOOST_LABELS[1], BOOST_LABELS[2]],
-            command=lambda label: self._on_cpu_option(mode, "boost_mode", boost_label_to_value(label)),
+            command=functools.partial(self._on_boost_selected, mode),
         )
         boost_menu.set(BOOST_LABELS.get(int(pol.boost_mode), BOOST_LABELS[1]))
         boost_menu.pack(fill="x", padx=10, pady=(0, 8))
@@ -734,7 +1182,7 @@ class HzApp(ctk.CTk):
         max_label.pack(anchor="e", padx=10, pady=(0, 0))
         max_slider = ctk.CTkSlider(
             parent, from_=1, to=100, number_of_steps=99,
-            command=lambda v: self._on_cpu_slider(mode, "cpu_max", int(v), max_label)
+            command=functools.partial(self._on_cpu_slider, mode, "cpu_max", max_label)
         )
         max_slider.set(int(pol.cpu_max))
         max_slider.pack(fill="x", padx=10, pady=(0, 8))
@@ -745,7 +1193,7 @@ class HzApp(ctk.CTk):
         min_label.pack(anchor="e", padx=10, pady=(0, 0))
         min_slider = ctk.CTkSlider(
             parent, from_=0, to=100, number_of_steps=100,
-            command=lambda v: self._on_cpu_slider(mode, "cpu_min", int(v), min_label)
+            command=functools.partial(self._on_cpu_slider, mode, "cpu_min", min_label)
         )
         min_slider.set(int(pol.cpu_min))
         min_slider.pack(fill="x", padx=10, pady=(0, 8))
@@ -756,7 +1204,7 @@ class HzApp(ctk.CTk):
         park_label.pack(anchor="e", padx=10, pady=(0, 0))
         park_slider = ctk.CTkSlider(
             parent, from_=0, to=100, number_of_steps=100,
-            command=lambda v: self._on_cpu_slider(mode, "core_parking_min", int(v), park_label)
+            command=functools.partial(self._on_cpu_slider, mode, "core_parking_min", park_label)
         )
         park_slider.set(int(pol.core_parking_min))
         park_slider.pack(fill="x", padx=10, pady=(0, 8))
@@ -766,7 +1214,7 @@ class HzApp(ctk.CTk):
         cool_menu = ctk.CTkOptionMenu(
             parent,
             values=[COOLING_LABELS[1], COOLING_LABELS[0]],
-            command=lambda label: self._on_cpu_option(mode, "cooling_policy", cooling_label_to_value(label)),
+            command=functools.partial(self._on_cooling_selected, mode),
         )
         cool_menu.set(COOLING_LABELS.get(int(pol.cooling_policy), COOLING_LABELS[1]))
         cool_menu.pack(fill="x", padx=10, pady=(0, 8))
@@ -774,24 +1222,38 @@ class HzApp(ctk.CTk):
         apply_btn = ctk.CTkButton(
             parent,
             text="Bu Sekmenin CPU Policy'sini Seçili Planına Yaz",
-            command=lambda: self.ui_apply_cpu_policy_tab(mode),
+            command=functools.partial(self.ui_apply_cpu_policy_tab, mode),
         )
         apply_btn.pack(fill="x", padx=10, pady=(10, 10))
 
-    def _on_cpu_slider(self, mode: str, field_name: str, value: int, label_widget):
-        label_widget.configure(text=str(int(value)))
+        parent.pack_propagate(True)
+        parent.update_idletasks()
+
+    def _on_cpu_slider(self, mode: str, field_name: str, label_widget, value):
+        # Hızlı sürüklemede birçok event aynı integer'ı üretir; değişmediyse
+        # configure çağırma
+        txt = str(int(value))
+        if getattr(label_widget, "_last_txt", None) != txt:
+            label_widget._last_txt = txt
+            label_widget.configure(text=txt)
         pol = self.cfg.cpu_ac if mode == "ac" else self.cfg.cpu_bat
         setattr(pol, field_name, int(value))
 
         if pol.cpu_min > pol.cpu_max:
             pol.cpu_min = pol.cpu_max
 
-        save_config(self.cfg)
+        self._schedule_save()
 
     def _on_cpu_option(self, mode: str, field_name: str, value: int):
         pol = self.cfg.cpu_ac if mode == "ac" else self.cfg.cpu_bat
         setattr(pol, field_name, int(value))
-        save_config(self.cfg)
+        self._schedule_save()
+
+    def _on_boost_selected(self, mode: str, label: str):
+        self._on_cpu_option(mode, "boost_mode", boost_label_to_value(label))
+
+    def _on_cooling_selected(self, mode: str, label: str):
+        self._on_cpu_option(mode, "cooling_policy", cooling_label_to_value(label))
 
     # ----------------- STATUS -----------------
     def _status_text(self) -> str:
@@ -810,27 +1272,64 @@ class HzApp(ctk.CTk):
         return f"Şu anki: {cur_txt}  •  Durum: {ptxt}  •  Aktif Plan: {plan_txt}"
 
     def refresh_status(self):
-        self.status_label.configure(text=self._status_text())
+        if not self._visible.is_set():
+            return
+        txt = self._status_text()
+        if txt != self._last_status_str:
+            self._last_status_str = txt
+            self.status_label.configure(text=txt)
+
+    # ----------------- CONFIG SAVE (debounce) -----------------
+    def _schedule_save(self):
+        """
+        Slider sürüklerken her tick'te diske yazmamak için yazımı
+        400 ms debounce'la; sadece son cfg persist edilir.
+        """
+        if self._save_after_id is not None:
+            try:
+                self.after_cancel(self._save_after_id)
+            except Exception:
+                pass
+        self._save_after_id = self.after(400, self._do_save)
+
+    def _do_save(self):
+        self._save_after_id = None
+        save_config(self.cfg)
+
+    def _flush_pending_save(self):
+        if self._save_after_id is not None:
+            try:
+                self.after_cancel(self._save_after_id)
+            except Exception:
+                pass
+            self._save_after_id = None
+            save_config(self.cfg, durable=True)
 
     # ----------------- TOGGLES -----------------
     def on_toggle(self):
-        self.cfg.auto_mode = bool(self.switch_auto.get())
-        self.cfg.set_power_plan = bool(self.switch_power.get())
-        self.cfg.set_cpu_policy = bool(self.switch_cpu.get())
-        save_config(self.cfg)
+        # Üç switch'i tek seferde oku; hiçbiri değişmediyse yazma yok
+        auto = bool(self.switch_auto.get())
+        power = bool(self.switch_power.get())
+        cpu = bool(self.switch_cpu.get())
+        if (auto, power, cpu) == (self.cfg.auto_mode, self.cfg.set_power_plan, self.cfg.set_cpu_policy):
+            return
+        self.cfg.auto_mode = auto
+        self.cfg.set_power_plan = power
+        self.cfg.set_cpu_policy = cpu
+        self._schedule_save()
 
     # ----------------- Hz selection -----------------
     def on_ac_hz_selected(self, v: str):
         try:
             self.cfg.ac_hz = int(v)
-            save_config(self.cfg)
+            self._schedule_save()
         except Exception:
             pass
 
     def on_bat_hz_selected(self, v: str):
         try:
             self.cfg.battery_hz = int(v)
-            save_config(self.cfg)
+            self._schedule_save()
         except Exception:
             pass
 
@@ -838,15 +1337,12 @@ class HzApp(ctk.CTk):
     def refresh_power_plans(self, initial: bool = False):
         self.schemes = list_power_schemes()
 
-        self.scheme_display_list = []
-        self.display_to_guid = {}
-        self.guid_to_display = {}
-
-        for guid, name, _ in self.schemes:
-            disp = f"{name} — {guid}"
-            self.scheme_display_list.append(disp)
-            self.display_to_guid[disp] = guid
-            self.guid_to_display[guid.lower()] = disp
+        # Tek comprehension turu; lowercase GUID burada bir kere hesaplanır
+        self.scheme_display_list = [f"{name} — {guid}" for guid, name, _ in self.schemes]
+        self.display_to_guid = dict(zip(self.scheme_display_list, (g for g, _, _ in self.schemes)))
+        self.guid_to_display = {
+            g.lower(): disp for (g, _, _), disp in zip(self.schemes, self.scheme_display_list)
+        }
 
         if not self.scheme_display_list:
             self.scheme_display_list = ["(Power plan listesi okunamadı) — "]
@@ -863,9 +1359,13 @@ class HzApp(ctk.CTk):
 
     def ui_refresh_plans(self):
         self.refresh_power_plans(initial=False)
-        self.ac_plan_menu.configure(values=self.scheme_display_list)
-        self.bat_plan_menu.configure(values=self.scheme_display_list)
-        self._sync_plan_menus_from_config()
+        # Liste değişmediyse CTk menülerini yeniden kurdurma (pahalı)
+        sig = tuple((g, n) for g, n, _ in self.schemes)
+        if sig != self._schemes_sig:
+            self._schemes_sig = sig
+            self.ac_plan_menu.configure(values=self.scheme_display_list)
+            self.bat_plan_menu.configure(values=self.scheme_display_list)
+            self._sync_plan_menus_from_config()
         self.refresh_status()
 
     def _sync_plan_menus_from_config(self):
@@ -882,13 +1382,13 @@ class HzApp(ctk.CTk):
     def on_ac_plan_selected(self, display: str):
         guid = self.display_to_guid.get(display, "")
         self.cfg.ac_plan_guid = guid if guid else None
-        save_config(self.cfg)
+        self._schedule_save()
         self.after(0, self.refresh_status)
 
     def on_bat_plan_selected(self, display: str):
         guid = self.display_to_guid.get(display, "")
         self.cfg.battery_plan_guid = guid if guid else None
-        save_config(self.cfg)
+        self._schedule_save()
         self.after(0, self.refresh_status)
 
     def ui_restore_default_schemes(self):
@@ -927,25 +1427,43 @@ class HzApp(ctk.CTk):
         self.ui_refresh_plans()
 
     # ----------------- APPLY LOGIC -----------------
+    def _worker_loop(self):
+        while True:
+            func, args, on_done = self._worker_q.get()
+            try:
+                result = func(*args)
+            except Exception:
+                result = None
+            if on_done is not None:
+                self.after(0, lambda r=result: on_done(r))
+
+    def _submit(self, func, args=(), on_done=None):
+        """
+        İşi worker thread'ine atar; on_done (varsa) Tk main loop'unda koşar.
+        """
+        self._worker_q.put((func, args, on_done))
+
     def manual_apply(self, mode: str):
         self.cfg.auto_mode = False
         self.switch_auto.deselect()
-        save_config(self.cfg)
+        save_config(self.cfg, durable=True)
 
-        if mode == "ac":
-            self._apply_targets(plugged=True)
-        else:
-            self._apply_targets(plugged=False)
+        self._submit(self._apply_targets, (mode == "ac",))
 
     def _apply_targets(self, plugged: bool):
         target_hz = self.cfg.ac_hz if plugged else self.cfg.battery_hz
         target_plan = self.cfg.ac_plan_guid if plugged else self.cfg.battery_plan_guid
         pol = self.cfg.cpu_ac if plugged else self.cfg.cpu_bat
 
+        # Sahte plug event'lerinde mevcut durumla eşleşen hedefleri atla;
+        # TTL cache sayesinde bu kontroller neredeyse bedava
         if self.cfg.set_power_plan and target_plan:
-            set_power_scheme_by_guid(target_plan)
+            active_guid, _ = get_active_power_scheme()
+            if (active_guid or "").lower() != target_plan.lower():
+                set_power_scheme_by_guid(target_plan)
 
         if self.cfg.set_cpu_policy and target_plan:
+            # apply_cpu_policy_to_scheme değişmeyen policy'yi zaten no-op'lar
             apply_cpu_policy_to_scheme(
                 scheme_guid=target_plan,
                 plugged=plugged,
@@ -957,13 +1475,20 @@ class HzApp(ctk.CTk):
                 cooling_policy=pol.cooling_policy,
             )
 
-        if target_hz is not None:
+        if target_hz is not None and get_current_hz() != int(target_hz):
             set_hz(int(target_hz))
 
         self.after(0, self.refresh_status)
 
-    def apply_for_current_power_state(self):
-        plug = is_plugged_in()
+    def apply_now_async(self):
+        # UI handler'ları buradan girer; asıl iş worker thread'inde koşar
+        self._submit(self.apply_for_current_power_state)
+
+    def apply_for_current_power_state(self, plug: Optional[bool] = None):
+        # Güç durumu bir kere okunur ve aşağıya parametre olarak iner;
+        # apply ortasında AC durumu değişirse tutarsızlık olmaz.
+        if plug is None:
+            plug = is_plugged_in()
         if plug is None:
             return
 
@@ -987,51 +1512,62 @@ class HzApp(ctk.CTk):
         if not plan:
             return
 
-        apply_cpu_policy_to_scheme(
-            scheme_guid=plan,
-            plugged=plugged,
-            epp=pol.epp,
-            boost_mode=pol.boost_mode,
-            cpu_min=pol.cpu_min,
-            cpu_max=pol.cpu_max,
-            core_parking_min=pol.core_parking_min,
-            cooling_policy=pol.cooling_policy,
-        )
-        self.after(0, self.refresh_status)
+        def work():
+            apply_cpu_policy_to_scheme(
+                scheme_guid=plan,
+                plugged=plugged,
+                epp=pol.epp,
+                boost_mode=pol.boost_mode,
+                cpu_min=pol.cpu_min,
+                cpu_max=pol.cpu_max,
+                core_parking_min=pol.core_parking_min,
+                cooling_policy=pol.cooling_policy,
+            )
+
+        self._submit(work, on_done=lambda _r: self.refresh_status())
 
     # ----------------- MONITOR -----------------
     def battery_monitor(self):
+        # Event-driven: WM_POWERBROADCAST gelince uyanır; kaçan event'ler
+        # için heartbeat timeout'la yine de arada bir kontrol eder.
+        # Her uyanışta UI'a refresh itmek yok — status zaten değişimde ve
+        # pencere gösterilince yenileniyor.
         while True:
             try:
                 plug = is_plugged_in()
                 if self.cfg.auto_mode and plug is not None:
                     if plug != self._last_plug_state:
                         self._last_plug_state = plug
-                        self.apply_for_current_power_state()
-                else:
-                    self.after(0, self.refresh_status)
+                        get_current_hz.invalidate()
+                        get_active_power_scheme.invalidate()
+                        self.apply_for_current_power_state(plug)
             except Exception:
                 pass
-            time.sleep(MONITOR_INTERVAL_SEC)
+            _power_event.wait(timeout=MONITOR_HEARTBEAT_SEC)
+            _power_event.clear()
 
     # ----------------- TRAY -----------------
     def hide_window(self):
+        self._visible.clear()
         self.stop_live_updates()
         self.withdraw()
         self.create_tray_icon()
 
     def show_window(self):
+        # Icon ömür boyu tek; stop/yeniden kur (Shell_NotifyIcon round-trip)
+        # yerine sadece görünürlüğü kapat
         if self.icon:
             try:
-                self.icon.stop()
+                self.icon.visible = False
             except Exception:
                 pass
-        self.icon = None
         self.deiconify()
+        self._visible.set()
         self.start_live_updates()
         self.after(0, self.refresh_status)
 
     def quit_app(self):
+        self._flush_pending_save()
         self.stop_live_updates()
         if self.icon:
             try:
@@ -1042,21 +1578,35 @@ class HzApp(ctk.CTk):
         self.destroy()
         sys.exit()
 
-    def create_tray_icon(self):
-        if self.icon:
-            return
+    def _tray_show(self):
+        self.after(0, self.show_window)
+
+    def _tray_apply(self):
+        self.after(0, self.apply_now_async)
+
+    def _tray_quit(self):
+        self.after(0, self.quit_app)
 
+    @staticmethod
+    def _build_tray_image():
         image = Image.new("RGB", (64, 64), color=(31, 83, 141))
         d = ImageDraw.Draw(image)
         d.rectangle([10, 10, 54, 54], outline="white", width=3)
         d.text((18, 22), "PRO", fill="white")
+        return image
 
-        menu = (
-            item("Göster", lambda: self.after(0, self.show_window)),
-            item("Şimdi Uygula", lambda: self.after(0, self.apply_for_current_power_state)),
-            item("Çıkış", lambda: self.after(0, self.quit_app)),
-        )
-        self.icon = pystray.Icon("HzControlPro", image, APP_NAME, menu)
+    def create_tray_icon(self):
+        if self.icon:
+            try:
+                self.icon.visible = True
+            except Exception:
+                pass
+            return
+
+        if HzApp._tray_image is None:
+            HzApp._tray_image = self._build_tray_image()
+
+        self.icon = pystray.Icon("HzControlPro", HzApp._tray_image, APP_NAME, self._tray_menu)
         threading.Thread(target=self.icon.run, daemon=True).start()
 
     def open_launcher_update(self):
@@ -1110,13 +1660,8 @@ class HzApp(ctk.CTk):
     def check_launcher_update_background(self) -> None:
         def worker():
             try:
-                payload = _http_get_json(PROGRAMS_URL)
-                latest = None
-                for item in payload.get("programs", []):
-                    if item.get("id") == PROGRAM_ID:
-                        latest = item.get("version", "")
-                        break
-                if latest and _semver_tuple(latest) > _semver_tuple(APP_VERSION):
+                latest = check_for_update(self.cfg)
+                if latest and _semver_tuple(latest) > APP_VERSION_TUPLE:
                     self.after(0, lambda: self.show_update_prompt(latest))
             except Exception:
                 return